@@ -5,17 +5,50 @@ import json
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 
 CONFIG_PATH = PROJECT_ROOT / "config" / "paths.json"
-if not CONFIG_PATH.exists():
-    raise FileNotFoundError(f"Missing config file: {CONFIG_PATH}")
 
-_paths = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+# Runtime paths are resolved from CONFIG_PATH on first access (PEP 562),
+# so importers that only need PROJECT_ROOT never read paths.json.
+_RUNTIME_NAMES = (
+    "RUNTIME_ROOT",
+    "INCOMING_RAW",
+    "WORK_AI",
+    "ASSETS_FINAL",
+    "QC_NEEDS_REVIEW",
+    "OUTGOING_READY",
+    "LOGS",
+)
 
-RUNTIME_ROOT = Path(_paths["runtime_root"])
+_cache: dict = {}
 
-# Standard runtime locations (authoritative)
-INCOMING_RAW = RUNTIME_ROOT / "incoming" / "raw"
-WORK_AI = RUNTIME_ROOT / "work" / "ai"
-ASSETS_FINAL = RUNTIME_ROOT / "assets" / "final"
-QC_NEEDS_REVIEW = RUNTIME_ROOT / "qc" / "needs_review"
-OUTGOING_READY = RUNTIME_ROOT / "outgoing" / "ready_to_upload"
-LOGS = RUNTIME_ROOT / "logs"
+
+def _ensure_loaded() -> None:
+    if _cache:
+        return
+    if not CONFIG_PATH.exists():
+        raise FileNotFoundError(f"Missing config file: {CONFIG_PATH}")
+
+    _paths = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+
+    runtime_root = Path(_paths["runtime_root"])
+
+    # Standard runtime locations (authoritative)
+    _cache.update(
+        RUNTIME_ROOT=runtime_root,
+        INCOMING_RAW=runtime_root / "incoming" / "raw",
+        WORK_AI=runtime_root / "work" / "ai",
+        ASSETS_FINAL=runtime_root / "assets" / "final",
+        QC_NEEDS_REVIEW=runtime_root / "qc" / "needs_review",
+        OUTGOING_READY=runtime_root / "outgoing" / "ready_to_upload",
+        LOGS=runtime_root / "logs",
+    )
+
+
+def __getattr__(name: str):
+    if name in _RUNTIME_NAMES:
+        _ensure_loaded()
+        return _cache[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_RUNTIME_NAMES))
@@ -0,0 +1,92 @@
+"""
+JSON codec shared by title_builder.py and pipeline.py.
+
+orjson is used when installed; stdlib json otherwise. Output matches
+json.dumps(..., ensure_ascii=False, indent=2). orjson writes NaN/Infinity
+as null and exponent floats as 1e16 rather than 1e+16, so an encode whose
+bytes could hold either is re-checked and, if needed, redone with stdlib.
+Ints outside 64-bit make orjson raise and also fall back to stdlib.
+"""
+from __future__ import annotations
+
+import io
+import json
+import math
+import os
+import re
+from typing import Any, BinaryIO, Optional
+
+try:  # optional fast path
+    import orjson
+except ImportError:
+    orjson = None
+
+# Cheap byte scans for output that *might* differ from json.dumps: "null"
+# (NaN/Infinity) and an exponent ("1e16", "1e-05"). Either may also hit
+# plain None or string text; _float_differs then settles it.
+_EXP_RE = re.compile(rb"e-?[0-9]")
+
+
+def _float_differs(obj: Any) -> bool:
+    # Only reached on a scan hit: a non-finite or exponent-form float
+    if isinstance(obj, float):
+        return not math.isfinite(obj) or "e" in repr(obj)
+    if isinstance(obj, dict):
+        return any(_float_differs(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_float_differs(v) for v in obj)
+    return False
+
+
+def _orjson_dumps(obj: Any, indent: bool) -> Optional[bytes]:
+    # None -> caller uses stdlib
+    if orjson is None:
+        return None
+    opt = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+    try:
+        data = orjson.dumps(obj, option=opt)
+    except orjson.JSONEncodeError:
+        return None  # e.g. ints outside 64-bit
+    if (b"null" in data or _EXP_RE.search(data)) and _float_differs(obj):
+        return None
+    return data
+
+
+def loads(data: bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # NaN/Infinity literals, huge ints: let stdlib decide
+    return json.loads(data.decode("utf-8"))
+
+
+def dumps(obj: Any, indent: bool = True) -> str:
+    data = _orjson_dumps(obj, indent)
+    if data is not None:
+        return data.decode("utf-8")
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def dump_to(obj: Any, fp: BinaryIO) -> None:
+    """
+    Indented JSON written to a binary stream, with platform line endings
+    (same bytes as print()/write_text() of dumps(obj), on both backends).
+    Only the stdlib path streams; orjson builds the full bytes first.
+    """
+    data = _orjson_dumps(obj, indent=True)
+    if data is not None:
+        if os.linesep != "\n":
+            # raw newlines only occur between tokens; string content is escaped
+            data = data.replace(b"\n", os.linesep.encode("ascii"))
+        fp.write(data)
+        return
+    # json.dump writes chunk by chunk instead of building the whole string;
+    # newline=os.linesep translates "\n" the same way as the orjson branch
+    w = io.TextIOWrapper(fp, encoding="utf-8", newline=os.linesep, write_through=True)
+    try:
+        json.dump(obj, w, ensure_ascii=False, indent=2)
+    finally:
+        w.detach()
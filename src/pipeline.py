@@ -2,13 +2,18 @@
 from __future__ import annotations
 
 import argparse
-import json
+import functools
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 # Local module
-from title_builder import build_ebay_title
+import jsonio
+from title_builder import _norm_optional as norm_optional
+from title_builder import build_ebay_title, parse_serial
 
 ROOT = Path(__file__).resolve().parents[1]
 
@@ -20,27 +25,25 @@ ENFORCED_PATH = ROOT / "config" / "ebay" / "enforced_requirements" / "cat_261328
 # ----------------------------
 # Utils
 # ----------------------------
+@functools.lru_cache(maxsize=32)
+def _load_json_cached(path_str: str, mtime_ns: int) -> Any:
+    # mtime_ns is part of the cache key only: an edited file re-parses
+    return jsonio.loads(Path(path_str).read_bytes())
+
+
 def load_json(path: Path) -> Any:
+    """
+    Parsed JSON for path, cached per (path, mtime) so config files are only
+    read once per process. Callers must treat the result as read-only.
+    """
     if not path.exists():
         raise FileNotFoundError(f"Missing required file: {path}")
-    return json.loads(path.read_text(encoding="utf-8"))
+    return _load_json_cached(str(path), path.stat().st_mtime_ns)
 
 
-def dump_json(obj: Any) -> str:
-    return json.dumps(obj, ensure_ascii=False, indent=2)
-
-
-def norm_optional(val: Any) -> str:
-    if val is None or val is False:
-        return ""
-    if isinstance(val, str):
-        s = val.strip()
-        if not s:
-            return ""
-        if s.lower() in {"false", "no", "none", "n/a", "na"}:
-            return ""
-        return s
-    return ""
+def dump_json_line(obj: Any) -> str:
+    # compact, single line (NDJSON)
+    return jsonio.dumps(obj, indent=False)
 
 
 def strip_hash(s: str) -> str:
@@ -49,17 +52,9 @@ def strip_hash(s: str) -> str:
 
 
 def serial_denominator_only_no_slash(serial: Any) -> str:
-    s = norm_optional(serial)
-    if not s:
-        return ""
-    s = s.lower().replace("of", "/")
-    # "/99" or "12/99"
-    if "/" in s:
-        parts = s.split("/")
-        if len(parts) >= 2 and parts[-1].strip().isdigit():
-            return str(int(parts[-1].strip()))
-        return ""
-    return str(int(s)) if s.isdigit() else ""
+    # "/99" or "12/99" -> "99"
+    _, denom = parse_serial(serial)
+    return str(denom) if denom else ""
 
 
 def get_player_name(card: Dict[str, Any]) -> str:
@@ -71,30 +66,169 @@ def get_player_name(card: Dict[str, Any]) -> str:
 # ----------------------------
 # Schema helpers (names only, v1)
 # ----------------------------
-def schema_aspect_names(schema: Any) -> set:
+# id(schema) -> (schema, names); the schema ref guards against id reuse
+_ASPECT_NAMES_CACHE: Dict[int, Tuple[Any, frozenset]] = {}
+
+
+def schema_aspect_names(schema: Any) -> frozenset:
+    hit = _ASPECT_NAMES_CACHE.get(id(schema))
+    if hit is not None and hit[0] is schema:
+        return hit[1]
+
     names = set()
     if isinstance(schema, list):
         for a in schema:
             if isinstance(a, dict) and a.get("name"):
                 names.add(str(a["name"]))
-    return names
+    result = frozenset(names)
+    _ASPECT_NAMES_CACHE[id(schema)] = (schema, result)
+    return result
+
+
+# ----------------------------
+# Compiled enforced rules
+# ----------------------------
+@dataclass(frozen=True, slots=True)
+class PipelineRules:
+    """
+    enforced_requirements pre-walked once per run; build_item_specifics reads
+    these fields instead of re-validating the raw JSON per card.
+    """
+    derive: Tuple[Tuple[str, str, str], ...]       # (target, from, transform)
+    league_by_sport: Dict[str, str]
+    event_by_sport: Dict[str, str]
+    thickness_rule: bool
+    thickness_default: str
+    autograph_rule: bool                           # autograph_rules.Autographed present
+    when_no: Dict[str, Any]
+    when_yes: bool
+    when_yes_signed_from_player: bool
+    when_yes_auth_value: Optional[str]             # None -> leave as-is
+    when_yes_af_allowed: frozenset                 # empty -> no format policy
+    parallel_default: Optional[str]                # None -> no parallel rule
+    features_default: Optional[Tuple[str, ...]]    # None -> no features rule
+    blank_prop65: bool
+
+
+def _by_sport(aspect_cfg: Any) -> Dict[str, str]:
+    # first rule per sport wins (matches the old per-card scan + break)
+    out: Dict[str, str] = {}
+    if not isinstance(aspect_cfg, dict):
+        return out
+    rules = aspect_cfg.get("rules", [])
+    if not isinstance(rules, list):
+        return out
+    for r in rules:
+        if not isinstance(r, dict):
+            continue
+        when = r.get("when", {})
+        if isinstance(when, dict) and isinstance(when.get("Sport"), str):
+            out.setdefault(when["Sport"], norm_optional(r.get("value")))
+    return out
+
+
+def compile_rules(enforced: Dict[str, Any]) -> PipelineRules:
+    derive: List[Tuple[str, str, str]] = []
+    dae = enforced.get("derive_and_enforce", {})
+    if isinstance(dae, dict):
+        for target, rule in dae.items():
+            if isinstance(rule, dict):
+                derive.append((target, rule.get("from") or "", rule.get("transform") or ""))
+
+    ca = enforced.get("conditional_aspects", {})
+    if not isinstance(ca, dict):
+        ca = {}
+    thickness = ca.get("Card Thickness")
+    thickness_rule = isinstance(thickness, dict)
+
+    ar = enforced.get("autograph_rules", {})
+    blk = ar.get("Autographed") if isinstance(ar, dict) else None
+    autograph_rule = isinstance(blk, dict)
+    if not autograph_rule:
+        blk = {}
+    when_no = blk.get("when_no", {})
+    when_yes = blk.get("when_yes", {})
+    has_when_yes = isinstance(when_yes, dict)
+    if not has_when_yes:
+        when_yes = {}
+    sb = when_yes.get("Signed By")
+    aa = when_yes.get("Autograph Authentication")
+    af = when_yes.get("Autograph Format")
+    af_allowed = af.get("allowed_by_policy", []) if isinstance(af, dict) else []
+
+    pvr = enforced.get("parallel_variety_rules", {})
+    parallel_default = pvr.get("default", "[Base]") if isinstance(pvr, dict) else None
+
+    fr = enforced.get("features_rules", {})
+    features_default: Optional[Tuple[str, ...]] = None
+    if isinstance(fr, dict):
+        d = fr.get("default_if_none_detected", ["Base Set"])
+        features_default = tuple(d) if isinstance(d, list) else (d,)
+
+    return PipelineRules(
+        derive=tuple(derive),
+        league_by_sport=_by_sport(ca.get("League")),
+        event_by_sport=_by_sport(ca.get("Event/Tournament")),
+        thickness_rule=thickness_rule,
+        thickness_default=norm_optional(thickness.get("default")) if thickness_rule else "",
+        autograph_rule=autograph_rule,
+        when_no=dict(when_no) if isinstance(when_no, dict) else {},
+        when_yes=has_when_yes,
+        when_yes_signed_from_player=isinstance(sb, dict) and sb.get("from") == "player_name",
+        when_yes_auth_value=aa.get("value") if isinstance(aa, dict) else None,
+        when_yes_af_allowed=frozenset(af_allowed or ()),
+        parallel_default=parallel_default,
+        features_default=features_default,
+        blank_prop65="California Prop 65 Warning" in ca,
+    )
 
 
 # ----------------------------
 # Build item specifics
 # ----------------------------
+# aspect -> card keys tried in order; first non-empty value wins
+_DIRECT_MAP_SPECS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("Player/Athlete", ("player_athlete", "Player/Athlete")),
+    ("Manufacturer", ("Manufacturer", "brand")),
+    ("Set", ("Set", "set", "set_name")),
+    ("Team", ("Team", "team_name", "team")),
+    ("Season", ("Season", "year")),
+    ("Year Manufactured", ("Year Manufactured", "year")),
+    ("Parallel/Variety", ("Parallel/Variety", "parallel")),
+    ("Features", ("Features",)),
+    ("Insert Set", ("Insert Set", "insert_set", "insert")),
+    ("Autographed", ("Autographed", "autographed")),
+    ("Professional Grader", ("Professional Grader", "grading_company", "grader")),
+    ("Grade", ("Grade", "grade", "numerical_grade")),
+    ("Card Thickness", ("Card Thickness",)),
+    ("Event/Tournament", ("Event/Tournament",)),
+    ("League", ("League",)),
+    ("Card Name", ("Card Name",)),
+    ("Card Number", ("Card Number", "card_number")),
+    ("Print Run", ("Print Run",)),
+    ("Signed By", ("Signed By",)),
+    ("Autograph Authentication", ("Autograph Authentication",)),
+    ("Autograph Authentication Number", ("Autograph Authentication Number",)),
+    ("Autograph Format", ("Autograph Format",)),
+    ("California Prop 65 Warning", ("California Prop 65 Warning",)),
+    ("Sport", ("Sport", "sport")),
+    ("Type", ("Type",)),
+)
+
+
 def build_item_specifics(
     card: Dict[str, Any],
     globals_defaults: Dict[str, Any],
-    enforced: Dict[str, Any],
+    rules: PipelineRules,
 ) -> Dict[str, Any]:
     """
     v1 rules:
       - globals_defaults inject always
-      - enforced derivations + conditional mappings
+      - enforced derivations + conditional mappings (pre-compiled via compile_rules)
       - no allowed-values validation yet (next step)
     """
     item: Dict[str, Any] = {}
+    player_name = get_player_name(card)
 
     # 1) Start with globals (flat dict of aspect->value)
     # globals_defaults is expected to be a plain dict of aspect->value
@@ -103,153 +237,103 @@ def build_item_specifics(
 
     # 2) Copy obvious direct fields if present (typed or dropdown)
     # (No guessing; only pass through if non-empty)
-    direct_map = {
-        "Player/Athlete": card.get("player_athlete") or card.get("Player/Athlete") or get_player_name(card),
-        "Manufacturer": card.get("Manufacturer") or card.get("brand"),
-        "Set": card.get("Set") or card.get("set") or card.get("set_name"),
-        "Team": card.get("Team") or card.get("team_name") or card.get("team"),
-        "Season": card.get("Season") or card.get("year"),
-        "Year Manufactured": card.get("Year Manufactured") or card.get("year"),
-        "Parallel/Variety": card.get("Parallel/Variety") or card.get("parallel"),
-        "Features": card.get("Features"),
-        "Insert Set": card.get("Insert Set") or card.get("insert_set") or card.get("insert"),
-        "Autographed": card.get("Autographed") or card.get("autographed"),
-        "Professional Grader": card.get("Professional Grader") or card.get("grading_company") or card.get("grader"),
-        "Grade": card.get("Grade") or card.get("grade") or card.get("numerical_grade"),
-        "Card Thickness": card.get("Card Thickness"),
-        "Event/Tournament": card.get("Event/Tournament"),
-        "League": card.get("League"),
-        "Card Name": card.get("Card Name"),
-        "Card Number": card.get("Card Number") or card.get("card_number"),
-        "Print Run": card.get("Print Run"),
-        "Signed By": card.get("Signed By"),
-        "Autograph Authentication": card.get("Autograph Authentication"),
-        "Autograph Authentication Number": card.get("Autograph Authentication Number"),
-        "Autograph Format": card.get("Autograph Format"),
-        "California Prop 65 Warning": card.get("California Prop 65 Warning"),
-        "Sport": card.get("Sport") or card.get("sport"),
-        "Type": card.get("Type"),
-    }
-
-    # normalize booleans/false strings to blank for optional fields
-    for aspect, raw in direct_map.items():
+    # Player/Athlete falls back to first+last; Features may be a list
+    for aspect, keys in _DIRECT_MAP_SPECS:
+        raw = next((card[k] for k in keys if card.get(k)), None)
         if aspect == "Features":
             # features can be list or string; accept list; blank otherwise
             if isinstance(raw, list) and raw:
                 item[aspect] = [str(x).strip() for x in raw if str(x).strip()]
             elif isinstance(raw, str) and raw.strip():
                 item[aspect] = raw.strip()
-        else:
-            s = norm_optional(raw)
-            if s:
-                item[aspect] = s
+            continue
+        if raw is None and aspect == "Player/Athlete":
+            raw = player_name
+        # normalize booleans/false strings to blank for optional fields
+        s = norm_optional(raw)
+        if s:
+            item[aspect] = s
 
     # 3) Apply enforce/derive rules (from enforced_requirements)
-    dae = enforced.get("derive_and_enforce", {})
-    if isinstance(dae, dict):
-        for target, rule in dae.items():
-            if not isinstance(rule, dict):
-                continue
-            src = rule.get("from")
-            xform = rule.get("transform")
-
-            val = ""
-            if src == "player_name":
-                val = get_player_name(card)
-            elif src == "card_number":
-                val = str(card.get("card_number", "")).strip()
-            elif src == "serial_number":
-                val = str(card.get("serial_number", "")).strip()
-            elif src == "year":
-                val = str(card.get("year", "")).strip()
-
-            if xform == "strip_hash":
-                val = strip_hash(val)
-            elif xform == "serial_denominator_only_no_slash":
-                val = serial_denominator_only_no_slash(val)
-
-            if val:
-                item[target] = val
+    for target, src, xform in rules.derive:
+        val = ""
+        if src == "player_name":
+            val = player_name
+        elif src == "card_number":
+            val = str(card.get("card_number", "")).strip()
+        elif src == "serial_number":
+            val = str(card.get("serial_number", "")).strip()
+        elif src == "year":
+            val = str(card.get("year", "")).strip()
+
+        if xform == "strip_hash":
+            val = strip_hash(val)
+        elif xform == "serial_denominator_only_no_slash":
+            val = serial_denominator_only_no_slash(val)
+
+        if val:
+            item[target] = val
 
     # 4) Conditional aspects (Sport->League/Event, thickness default/exception, Prop65 blank)
-    ca = enforced.get("conditional_aspects", {})
-    sport = (item.get("Sport") or "").strip()
-
-    if isinstance(ca, dict):
-        # Prop 65 explicit blank
-        if "California Prop 65 Warning" in ca:
-            item["California Prop 65 Warning"] = ""
-
-        # League / Event mappings
-        for k in ("League", "Event/Tournament"):
-            if k in ca and isinstance(ca[k], dict) and sport:
-                rules = ca[k].get("rules", [])
-                if isinstance(rules, list):
-                    for r in rules:
-                        when = r.get("when", {})
-                        if isinstance(when, dict) and when.get("Sport") == sport:
-                            v = norm_optional(r.get("value"))
-                            if v:
-                                item[k] = v
-                            break
-
-        # Card Thickness default unless Memorabilia feature
-        if "Card Thickness" in ca and isinstance(ca["Card Thickness"], dict):
-            if not norm_optional(item.get("Card Thickness")):
-                default = norm_optional(ca["Card Thickness"].get("default"))
-                if default:
-                    item["Card Thickness"] = default
-
-            feats = item.get("Features", [])
-            feats_text = " ".join(feats) if isinstance(feats, list) else str(feats)
-            if "Memorabilia" in feats_text:
-                item["Card Thickness"] = ""
+    # Sport may also come from globals_defaults, which are not normalized
+    sport = norm_optional(item.get("Sport"))
+
+    # Prop 65 explicit blank
+    if rules.blank_prop65:
+        item["California Prop 65 Warning"] = ""
+
+    # League / Event mappings
+    if sport:
+        v = rules.league_by_sport.get(sport)
+        if v:
+            item["League"] = v
+        v = rules.event_by_sport.get(sport)
+        if v:
+            item["Event/Tournament"] = v
+
+    # Card Thickness default unless Memorabilia feature
+    if rules.thickness_rule:
+        if rules.thickness_default and not norm_optional(item.get("Card Thickness")):
+            item["Card Thickness"] = rules.thickness_default
+
+        # Features_any: ["Memorabilia"] -> exact feature match
+        feats = item.get("Features") or []
+        feats_set = set(feats) if isinstance(feats, list) else {feats}
+        if "Memorabilia" in feats_set:
+            item["Card Thickness"] = ""
 
     # 5) Autograph dependencies (No -> blanks; Yes -> set Signed By/Auth/etc.)
-    ar = enforced.get("autograph_rules", {})
-    if isinstance(ar, dict) and isinstance(ar.get("Autographed"), dict):
-        blk = ar["Autographed"]
-        auto = norm_optional(item.get("Autographed"))
-        if auto.lower() == "no":
-            when_no = blk.get("when_no", {})
-            if isinstance(when_no, dict):
-                for k, v in when_no.items():
-                    item[k] = v
-        elif auto.lower() == "yes":
-            when_yes = blk.get("when_yes", {})
-            if isinstance(when_yes, dict):
-                # Signed By = player name (override allowed)
-                sb = when_yes.get("Signed By")
-                if isinstance(sb, dict) and sb.get("from") == "player_name":
-                    item["Signed By"] = get_player_name(card)
-
-                aa = when_yes.get("Autograph Authentication")
-                if isinstance(aa, dict) and "value" in aa:
-                    item["Autograph Authentication"] = aa["value"]
-
-                # Always blank auth number per your lock
-                item["Autograph Authentication Number"] = ""
-
-                # Autograph Format: never allow Cut (policy). If present and not allowed -> blank.
-                af = when_yes.get("Autograph Format")
-                if isinstance(af, dict):
-                    allowed = af.get("allowed_by_policy", [])
-                    current = norm_optional(item.get("Autograph Format"))
-                    if current and allowed and current not in allowed:
-                        item["Autograph Format"] = ""
+    if rules.autograph_rule:
+        auto = norm_optional(item.get("Autographed")).lower()
+        if auto == "no":
+            item.update(rules.when_no)
+        elif auto == "yes" and rules.when_yes:
+            # Signed By = player name (override allowed)
+            if rules.when_yes_signed_from_player:
+                item["Signed By"] = player_name
+
+            if rules.when_yes_auth_value is not None:
+                item["Autograph Authentication"] = rules.when_yes_auth_value
+
+            # Always blank auth number per your lock
+            item["Autograph Authentication Number"] = ""
+
+            # Autograph Format: never allow Cut (policy). If present and not allowed -> blank.
+            if rules.when_yes_af_allowed:
+                current = norm_optional(item.get("Autograph Format"))
+                if current and current not in rules.when_yes_af_allowed:
+                    item["Autograph Format"] = ""
 
     # 6) Parallel default [Base]
-    pvr = enforced.get("parallel_variety_rules", {})
-    if isinstance(pvr, dict):
+    if rules.parallel_default is not None:
         if not norm_optional(item.get("Parallel/Variety")):
-            item["Parallel/Variety"] = pvr.get("default", "[Base]")
+            item["Parallel/Variety"] = rules.parallel_default
 
     # 7) Features default Base Set if missing
-    fr = enforced.get("features_rules", {})
-    if isinstance(fr, dict):
+    if rules.features_default is not None:
         feats = item.get("Features")
         if not feats:
-            item["Features"] = fr.get("default_if_none_detected", ["Base Set"])
+            item["Features"] = list(rules.features_default)
 
     # 8) Print Run: if serial present, enforce derived denominator
     # (even if UI allows typing; your lock says derived)
@@ -267,36 +351,25 @@ def build_item_specifics(
 
 
 # ----------------------------
-# Main
+# Payload
 # ----------------------------
-def main() -> int:
-    ap = argparse.ArgumentParser(description="GLSCLP Pipeline (no eBay push).")
-    ap.add_argument("--in", dest="in_path", required=True, help="Input card JSON path")
-    ap.add_argument("--out", dest="out_path", default="", help="Optional output JSON path")
-    args = ap.parse_args()
-
-    card_path = Path(args.in_path)
-    if not card_path.exists():
-        print(f"Input file not found: {card_path}", file=sys.stderr)
-        return 1
-
-    card = load_json(card_path)
-    schema = load_json(SCHEMA_PATH)
-    globals_defaults = load_json(GLOBALS_PATH)
-    enforced = load_json(ENFORCED_PATH)
-
+def build_payload(
+    card: Dict[str, Any],
+    allowed_names: frozenset,
+    globals_defaults: Dict[str, Any],
+    rules: PipelineRules,
+) -> Dict[str, Any]:
     # Title (from title_builder.py)
     title, dropped = build_ebay_title(card)
 
     # Item specifics
-    item_specifics = build_item_specifics(card, globals_defaults, enforced)
+    item_specifics = build_item_specifics(card, globals_defaults, rules)
 
     # Minimal schema-aware check (names only; values validation is next)
-    allowed_names = schema_aspect_names(schema)
-    unknown_names = sorted([k for k in item_specifics.keys() if k not in allowed_names])
+    unknown_names = sorted(item_specifics.keys() - allowed_names)
     # Keep unknowns in _debug for now (don’t delete silently)
     # You can flip this to an error later.
-    payload: Dict[str, Any] = {
+    return {
         "category_id": "261328",
         "title": title,
         "item_specifics": item_specifics,
@@ -307,14 +380,200 @@ def main() -> int:
         },
     }
 
-    # Always stdout
-    print(dump_json(payload))
+
+# ----------------------------
+# Batch (config loaded once, one NDJSON line per card)
+# ----------------------------
+def _list_dir(in_dir: Path, exclude: Optional[Path] = None) -> List[Path]:
+    # Listed eagerly, before --out is created, so the output file is never read back as a card
+    skip = exclude.resolve() if exclude else None
+    return [p for p in sorted(in_dir.glob("*.json")) if p.resolve() != skip]
+
+
+def _iter_dir(paths: List[Path]) -> Iterator[Tuple[str, Optional[bytes]]]:
+    # raw=None: the file is read where the card is processed (in the worker, if pooled)
+    for p in paths:
+        yield str(p), None
+
+
+def _iter_stdin() -> Iterator[Tuple[str, Optional[bytes]]]:
+    for n, line in enumerate(sys.stdin.buffer, 1):
+        line = line.strip()
+        if line:
+            yield f"<stdin>:{n}", line
+
+
+def _process_raw(
+    label: str,
+    raw: Optional[bytes],
+    allowed_names: frozenset,
+    globals_defaults: Dict[str, Any],
+    rules: PipelineRules,
+) -> Tuple[str, str]:
+    """
+    Returns: (ndjson_line, "") on success, ("", error) on failure.
+    raw=None means label is a card path to read.
+    Any per-card error (unreadable file, bad JSON, unexpected field types,
+    over-long mandatory title) fails that card, not the batch.
+    """
+    try:
+        if raw is None:
+            raw = Path(label).read_bytes()
+        card = jsonio.loads(raw)
+        if not isinstance(card, dict):
+            raise ValueError("card JSON must be an object")
+        line = dump_json_line(build_payload(card, allowed_names, globals_defaults, rules))
+    except Exception as e:  # any bad card fails alone; the batch keeps going
+        return "", f"{label}: {type(e).__name__}: {e}"
+    return line, ""
+
+
+# Per-process config for pool workers (set once by _init_worker)
+_WORKER_CTX: Optional[Tuple[frozenset, Dict[str, Any], PipelineRules]] = None
+
+
+def _init_worker(
+    allowed_names: frozenset,
+    globals_defaults: Dict[str, Any],
+    rules: PipelineRules,
+) -> None:
+    global _WORKER_CTX
+    _WORKER_CTX = (allowed_names, globals_defaults, rules)
+
+
+def _worker(src: Tuple[str, Optional[bytes]]) -> Tuple[str, str]:
+    assert _WORKER_CTX is not None
+    return _process_raw(src[0], src[1], *_WORKER_CTX)
+
+
+def run_batch(
+    sources: Iterable[Tuple[str, Optional[bytes]]],
+    allowed_names: frozenset,
+    globals_defaults: Dict[str, Any],
+    rules: PipelineRules,
+    out_path: Optional[Path] = None,
+    workers: int = 1,
+) -> int:
+    """
+    workers > 1 fans cards out over a process pool (config shipped once per
+    worker); output order always matches input order.
+    """
+    failures = 0
+    out_f = None
+    pool = None
+    sys.stdout.flush()
+    stdout = sys.stdout.buffer
+    eol = os.linesep.encode("ascii")
+    if out_path:
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_f = out_path.open("w", encoding="utf-8")
+    try:
+        if workers > 1:
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(allowed_names, globals_defaults, rules),
+            )
+            results = pool.map(_worker, sources, chunksize=32)
+        else:
+            results = (
+                _process_raw(label, raw, allowed_names, globals_defaults, rules)
+                for label, raw in sources
+            )
+
+        for line, err in results:
+            if err:
+                print(err, file=sys.stderr)
+                failures += 1
+                continue
+            # stdout is UTF-8 in every mode (see main), not the console locale
+            stdout.write(line.encode("utf-8") + eol)
+            if out_f:
+                out_f.write(line + "\n")
+    finally:
+        stdout.flush()
+        if pool:
+            pool.shutdown()
+        if out_f:
+            out_f.close()
+
+    if failures:
+        print(f"{failures} card(s) failed", file=sys.stderr)
+        return 1
+    return 0
+
+
+# ----------------------------
+# Main
+# ----------------------------
+def main() -> int:
+    ap = argparse.ArgumentParser(
+        description="GLSCLP Pipeline (no eBay push).",
+        epilog="JSON on stdout and in --out files is always UTF-8, whatever the console encoding.",
+    )
+    src = ap.add_mutually_exclusive_group(required=True)
+    src.add_argument("--in", dest="in_path", help="Input card JSON path")
+    src.add_argument("--in-dir", dest="in_dir", help="Batch: process every *.json in this folder")
+    src.add_argument("--batch-stdin", action="store_true", help="Batch: read NDJSON cards from stdin")
+    ap.add_argument(
+        "--out",
+        dest="out_path",
+        default="",
+        help="Optional output JSON path (batch modes: NDJSON path)",
+    )
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=(
+            "Batch modes: worker processes (0 = one per CPU; default 1 = in-process). "
+            "With a pool, --batch-stdin reads all of stdin before output starts."
+        ),
+    )
+    args = ap.parse_args()
+    if args.workers is not None:
+        if args.in_path:
+            ap.error("--workers only applies to --in-dir / --batch-stdin")
+        if args.workers < 0:
+            ap.error("--workers must be >= 0")
+
+    if args.in_path:
+        card_path = Path(args.in_path)
+        if not card_path.exists():
+            print(f"Input file not found: {card_path}", file=sys.stderr)
+            return 1
+    elif args.in_dir and not Path(args.in_dir).is_dir():
+        print(f"Input folder not found: {args.in_dir}", file=sys.stderr)
+        return 1
+
+    allowed_names = schema_aspect_names(load_json(SCHEMA_PATH))
+    globals_defaults = load_json(GLOBALS_PATH)
+    rules = compile_rules(load_json(ENFORCED_PATH))
+
+    if not args.in_path:
+        out_path = Path(args.out_path) if args.out_path else None
+        if args.in_dir:
+            sources = _iter_dir(_list_dir(Path(args.in_dir), exclude=out_path))
+        else:
+            sources = _iter_stdin()
+        workers = 1 if args.workers is None else args.workers or (os.cpu_count() or 1)
+        return run_batch(sources, allowed_names, globals_defaults, rules, out_path, workers)
+
+    card = load_json(card_path)
+    payload = build_payload(card, allowed_names, globals_defaults, rules)
+
+    # Always stdout (UTF-8 bytes; only the stdlib fallback streams)
+    sys.stdout.flush()
+    jsonio.dump_to(payload, sys.stdout.buffer)
+    sys.stdout.buffer.write(os.linesep.encode("ascii"))
+    sys.stdout.buffer.flush()
 
     # Optional file output (auto-create folders)
     if args.out_path:
         out_path = Path(args.out_path)
         out_path.parent.mkdir(parents=True, exist_ok=True)
-        out_path.write_text(dump_json(payload), encoding="utf-8")
+        with out_path.open("wb") as f:
+            jsonio.dump_to(payload, f)
 
     return 0
 
@@ -1,25 +1,31 @@
 from __future__ import annotations
 
-import json
 import re
 import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+import jsonio  # local module
+
 EBAY_TITLE_MAX = 80
 
+_WS_RE = re.compile(r"\s+")
+# "of" as a slash: between digits ("1of25", "1 of 25") or leading ("of99")
+_OF_RE = re.compile(r"(?<=\d)\s*of\s*|\bof", re.IGNORECASE)
+_FRAC_RE = re.compile(r"(\d+)\s*/\s*(\d+)")
+_DENOM_RE = re.compile(r"/\s*(\d+)")
+
+# Longest entry is 5 chars, so longer strings can skip the lower()+lookup.
+_FALSY = frozenset(("false", "no", "none", "n/a", "na"))
+
 
 def _clean(s: str) -> str:
     s = (s or "").strip()
-    s = re.sub(r"\s+", " ", s)
+    s = _WS_RE.sub(" ", s)
     return s
 
 
-def _join_tokens(tokens: List[str]) -> str:
-    return _clean(" ".join([_clean(t) for t in tokens if _clean(t)]))
-
-
 def _norm_optional(val: Any) -> str:
     """
     Optional field normalization:
@@ -34,12 +40,44 @@ def _norm_optional(val: Any) -> str:
         s = val.strip()
         if not s:
             return ""
-        if s.lower() in {"false", "no", "none", "n/a", "na"}:
+        if len(s) <= 5 and s.lower() in _FALSY:
             return ""
         return s
     return ""
 
 
+def parse_serial(serial_raw: Any) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Shared serial parser -> (first, denom); either may be None.
+    Accepts: "/99", "12/99", "099/199", "1 of 25", "1of25", "of99", "99" (denominator only).
+    A zero/missing denominator yields (None, None).
+    """
+    s = _norm_optional(serial_raw)
+    if not s:
+        return None, None
+
+    # normalize common variants: "of99" / "1 of 25" -> "/99" / "1 / 25"
+    s = _OF_RE.sub("/", s)
+
+    # full fraction like 12/99
+    m = _FRAC_RE.search(s)
+    if m:
+        first, denom = int(m.group(1)), int(m.group(2))
+    else:
+        # denom-only like "/99" or bare "99"
+        m = _DENOM_RE.search(s)
+        if m:
+            first, denom = None, int(m.group(1))
+        elif s.isdigit():
+            first, denom = None, int(s)
+        else:
+            return None, None
+
+    if denom <= 0:
+        return None, None
+    return first, denom
+
+
 def _parse_serial_for_ebay(serial_raw: Any) -> Optional[str]:
     """
     Title serial rules:
@@ -47,38 +85,16 @@ def _parse_serial_for_ebay(serial_raw: Any) -> Optional[str]:
     - Include leading number only if:
         a) first == 1  (e.g., 1/99)
         b) first == denom (e.g., 99/99)
-    Accepts: "/99", "12/99", "099/199", "1/1", "99/99", "of99" variants.
     """
-    s = _norm_optional(serial_raw)
-    if not s:
+    first, denom = parse_serial(serial_raw)
+    if denom is None:
         return None
+    if first == 1 or first == denom:
+        return f"{first}/{denom}"
+    return f"/{denom}"
 
-    # normalize common variants: "of99" -> "/99"
-    s = re.sub(r"\bof\b", "/", s, flags=re.IGNORECASE)
 
-    # full fraction like 12/99
-    m = re.search(r"(\d+)\s*/\s*(\d+)", s)
-    if m:
-        first = int(m.group(1))
-        denom = int(m.group(2))
-        if denom <= 0:
-            return None
-        if first == 1 or first == denom:
-            return f"{first}/{denom}"
-        return f"/{denom}"
-
-    # denom-only like "/99"
-    m2 = re.search(r"/\s*(\d+)", s)
-    if m2:
-        denom = int(m2.group(1))
-        if denom <= 0:
-            return None
-        return f"/{denom}"
-
-    return None
-
-
-@dataclass
+@dataclass(slots=True)
 class TitleInputs:
     # Required (always included)
     year: str
@@ -100,11 +116,9 @@ class TitleInputs:
     rookie: str = ""            # e.g. "Rookie" or "RC"
 
 
-def build_ebay_title(card: Dict[str, Any]) -> Tuple[str, List[str]]:
+def _extract_inputs(card: Dict[str, Any]) -> TitleInputs:
     """
-    Returns: (final_title, dropped_groups)
-    - dropped_groups are optional groups removed to satisfy 80-char limit.
-    Raises ValueError if mandatory fields alone exceed 80 characters.
+    Raw card dict -> TitleInputs (all fallback key chains resolved here).
     """
     # Required fields: stringify (but clean whitespace)
     year = _clean(str(card.get("year", "")))
@@ -114,7 +128,7 @@ def build_ebay_title(card: Dict[str, Any]) -> Tuple[str, List[str]]:
     player_last = _clean(str(card.get("player_last", card.get("player_last_name", ""))))
     card_number = _clean(str(card.get("card_number", card.get("card_no", ""))))
 
-    inp = TitleInputs(
+    return TitleInputs(
         year=year,
         brand=brand,
         set_name=set_name,
@@ -133,6 +147,20 @@ def build_ebay_title(card: Dict[str, Any]) -> Tuple[str, List[str]]:
         rookie=_norm_optional(card.get("rookie", card.get("rc"))),
     )
 
+
+def build_ebay_title(card: Dict[str, Any]) -> Tuple[str, List[str]]:
+    """
+    Card dict -> (final_title, dropped_groups); see build_title_from_inputs.
+    """
+    return build_title_from_inputs(_extract_inputs(card))
+
+
+def build_title_from_inputs(inp: TitleInputs) -> Tuple[str, List[str]]:
+    """
+    Returns: (final_title, dropped_groups)
+    - dropped_groups are optional groups removed to satisfy 80-char limit.
+    Raises ValueError if mandatory fields alone exceed 80 characters.
+    """
     # Mandatory block (per latest spec)
     mandatory_tokens = [
         inp.year,
@@ -147,16 +175,17 @@ def build_ebay_title(card: Dict[str, Any]) -> Tuple[str, List[str]]:
 
     # Optional groups in your latest token order:
     # Insert, Parallel, Auto/Patch, Serial, Grading Company, Numerical Grade, Team City, Team Name, Rookie
+    # Each group is a single value, cleaned once here; tokens are joined as-is below.
     group_values: Dict[str, str] = {
-        "insert": _join_tokens([inp.insert]),
-        "parallel": _join_tokens([inp.parallel]),
-        "auto_patch": _join_tokens([inp.auto_patch]),
-        "serial": _join_tokens([serial_fmt]),
-        "grading_company": _join_tokens([inp.grading_company]),
-        "numerical_grade": _join_tokens([inp.numerical_grade]),
-        "team_city": _join_tokens([inp.team_city]),
-        "team_name": _join_tokens([inp.team_name]),
-        "rookie": _join_tokens([inp.rookie]),
+        "insert": _clean(inp.insert),
+        "parallel": _clean(inp.parallel),
+        "auto_patch": _clean(inp.auto_patch),
+        "serial": serial_fmt,
+        "grading_company": _clean(inp.grading_company),
+        "numerical_grade": _clean(inp.numerical_grade),
+        "team_city": _clean(inp.team_city),
+        "team_name": _clean(inp.team_name),
+        "rookie": _clean(inp.rookie),
     }
 
     include_order = [
@@ -172,12 +201,9 @@ def build_ebay_title(card: Dict[str, Any]) -> Tuple[str, List[str]]:
     ]
 
     # Build initial title
-    tokens = mandatory_tokens[:]
-    for k in include_order:
-        if group_values.get(k):
-            tokens.append(group_values[k])
-
-    title = _join_tokens(tokens)
+    mandatory = [t for t in mandatory_tokens if t]
+    active = [(k, group_values[k]) for k in include_order if group_values[k]]
+    title = " ".join(mandatory + [v for _, v in active])
 
     # 80-char enforcement drop priority:
     # Drop lowest priority first. (Grading fields aren't specified in your priority list, so they drop low.)
@@ -194,25 +220,22 @@ def build_ebay_title(card: Dict[str, Any]) -> Tuple[str, List[str]]:
     ]
 
     dropped: List[str] = []
-    if len(title) > EBAY_TITLE_MAX:
-        active = dict(group_values)  # copy
+    current_len = len(title)
+    if current_len > EBAY_TITLE_MAX:
+        # Track length arithmetically; each dropped group also frees its separating space.
         for k in drop_priority:
-            if len(title) <= EBAY_TITLE_MAX:
+            if current_len <= EBAY_TITLE_MAX:
                 break
-            if active.get(k):
-                active[k] = ""
+            if group_values[k]:
                 dropped.append(k)
+                current_len -= len(group_values[k]) + 1
+        active = [(k, v) for k, v in active if k not in dropped]
+        title = " ".join(mandatory + [v for _, v in active])
 
-                rebuilt = mandatory_tokens[:]
-                for kk in include_order:
-                    if active.get(kk):
-                        rebuilt.append(active[kk])
-                title = _join_tokens(rebuilt)
-
-    if len(title) > EBAY_TITLE_MAX:
+    if current_len > EBAY_TITLE_MAX:
         raise ValueError(
             f"Mandatory fields exceed {EBAY_TITLE_MAX} chars after drops. "
-            f"Title='{title}' ({len(title)} chars)"
+            f"Title='{title}' ({current_len} chars)"
         )
 
     return title, dropped
@@ -224,7 +247,7 @@ def main() -> int:
         return 2
 
     p = Path(sys.argv[1])
-    card = json.loads(p.read_text(encoding="utf-8"))
+    card = jsonio.loads(p.read_bytes())
 
     title, dropped = build_ebay_title(card)
     print(title)
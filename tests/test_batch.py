@@ -0,0 +1,102 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+PIPELINE = Path(__file__).resolve().parents[1] / "src" / "pipeline.py"
+
+
+def _card(n):
+    return {
+        "year": "2017",
+        "brand": "Panini",
+        "set": "Prizm",
+        "player_first": "Player",
+        "player_last": f"No{n:03d}",
+        "card_number": str(n),
+        "serial_number": "/99",
+    }
+
+
+def _write_cards(d, count):
+    for n in range(count):
+        (d / f"card_{n:03d}.json").write_text(json.dumps(_card(n)), encoding="utf-8")
+
+
+def _run(*args):
+    return subprocess.run(
+        [sys.executable, str(PIPELINE), *args],
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+    )
+
+
+def _numbers(stdout):
+    return [json.loads(line)["item_specifics"]["Card Number"] for line in stdout.splitlines()]
+
+
+def test_in_dir_one_line_per_card(tmp_path):
+    _write_cards(tmp_path, 5)
+    out = tmp_path / "out.json"
+
+    r = _run("--in-dir", str(tmp_path), "--out", str(out))
+
+    assert r.returncode == 0, r.stderr
+    assert _numbers(r.stdout) == [str(n) for n in range(5)]
+    assert out.read_text(encoding="utf-8").splitlines() == r.stdout.splitlines()
+
+
+def test_bad_cards_reported_and_skipped(tmp_path):
+    _write_cards(tmp_path, 3)
+    (tmp_path / "card_001.json").write_text('{"player_first": 5}', encoding="utf-8")
+    (tmp_path / "card_bad.json").write_text("{not json", encoding="utf-8")
+
+    r = _run("--in-dir", str(tmp_path), "--workers", "2")
+
+    assert r.returncode == 1
+    assert _numbers(r.stdout) == ["0", "2"]
+    assert "card_001.json: AttributeError" in r.stderr
+    assert "card_bad.json:" in r.stderr
+    assert "2 card(s) failed" in r.stderr
+
+
+def test_pool_preserves_input_order(tmp_path):
+    _write_cards(tmp_path, 80)
+
+    serial = _run("--in-dir", str(tmp_path))
+    pooled = _run("--in-dir", str(tmp_path), "--workers", "3")
+
+    assert serial.returncode == pooled.returncode == 0, pooled.stderr
+    assert pooled.stdout == serial.stdout
+    assert _numbers(pooled.stdout) == [str(n) for n in range(80)]
+
+
+def test_batch_stdin(tmp_path):
+    lines = "\n".join(json.dumps(_card(n)) for n in range(3)) + "\n\n"
+
+    r = subprocess.run(
+        [sys.executable, str(PIPELINE), "--batch-stdin"],
+        input=lines,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+    )
+
+    assert r.returncode == 0, r.stderr
+    assert _numbers(r.stdout) == ["0", "1", "2"]
+
+
+def test_stdout_is_utf8_in_single_and_batch_modes(tmp_path):
+    card = dict(_card(1), player_first="José", player_last="Ramírez")
+    path = tmp_path / "card.json"
+    path.write_text(json.dumps(card, ensure_ascii=False), encoding="utf-8")
+    env = {**os.environ, "PYTHONIOENCODING": "cp1252"}
+
+    single = subprocess.run([sys.executable, str(PIPELINE), "--in", str(path)], capture_output=True, env=env)
+    batch = subprocess.run([sys.executable, str(PIPELINE), "--in-dir", str(tmp_path)], capture_output=True, env=env)
+
+    assert single.returncode == batch.returncode == 0
+    assert "José Ramírez".encode("utf-8") in single.stdout
+    assert json.loads(single.stdout.decode("utf-8")) == json.loads(batch.stdout.decode("utf-8"))
@@ -0,0 +1,30 @@
+import sys
+from pathlib import Path
+
+# src/ modules import each other as top-level scripts
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from pipeline import serial_denominator_only_no_slash  # noqa: E402
+from title_builder import _parse_serial_for_ebay, parse_serial  # noqa: E402
+
+
+def test_parse_serial_variants():
+    assert parse_serial("1of25") == (1, 25)
+    assert parse_serial("1 of 25") == (1, 25)
+    assert parse_serial("12 OF 99") == (12, 99)
+    assert parse_serial("of99") == (None, 99)
+    assert parse_serial("/99") == (None, 99)
+    assert parse_serial("99") == (None, 99)
+    assert parse_serial("0/0") == (None, None)
+    assert parse_serial("none") == (None, None)
+    assert parse_serial(None) == (None, None)
+
+
+def test_title_and_print_run_formats():
+    assert _parse_serial_for_ebay("1of25") == "1/25"
+    assert _parse_serial_for_ebay("25/25") == "25/25"
+    assert _parse_serial_for_ebay("12/99") == "/99"
+    assert _parse_serial_for_ebay("0/0") is None
+    assert serial_denominator_only_no_slash("1of25") == "25"
+    assert serial_denominator_only_no_slash("of99") == "99"
+    assert serial_denominator_only_no_slash("0/0") == ""
@@ -1,7 +1,17 @@
 from __future__ import annotations
-import json
+import functools
 import sys
 from pathlib import Path
+from typing import Callable
+
+# Share the pipeline's JSON codec (orjson with stdlib fallback)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+import jsonio  # noqa: E402
+
+try:  # optional: code-generated validators; frozenset fallback otherwise
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
 
 ROOT = Path(r"C:\GLSCLP\config")
 EBAY = ROOT / "ebay"
@@ -25,19 +35,125 @@ def fail(msg: str) -> None:
     FAILURES.append(msg)
 
 
+_EMPTY = object()
+
+
+@functools.lru_cache(maxsize=32)
+def _load_json_cached(path_str: str, mtime_ns: int):
+    # mtime_ns is part of the cache key only: an edited file re-parses
+    data = Path(path_str).read_bytes().strip()
+    if not data:
+        return _EMPTY
+    return jsonio.loads(data)
+
+
 def load_json(path: Path) -> dict:
     if not path.exists():
         fail(f"MISSING FILE: {path}")
         return {}
-    txt = path.read_text(encoding="utf-8").strip()
-    if not txt:
-        fail(f"EMPTY FILE: {path}")
-        return {}
     try:
-        return json.loads(txt)
+        data = _load_json_cached(str(path), path.stat().st_mtime_ns)
     except Exception as e:
         fail(f"INVALID JSON: {path} :: {e}")
         return {}
+    if data is _EMPTY:
+        fail(f"EMPTY FILE: {path}")
+        return {}
+    return data
+
+
+# ---- item_specifics validators (compiled once per category file) ----
+# (schema path, schema mtime_ns, enforced mtime_ns or 0) -> validator
+_COMPILED: dict[tuple[Path, int, int], Callable[[dict], dict]] = {}
+
+# entry_types whose values are not limited to eBay's dropdown list
+OPEN_ENTRY_TYPES = frozenset(("free_text", "override_allowed"))
+
+
+def aspects_to_json_schema(aspects: list, entry_types: dict | None = None) -> dict:
+    """
+    eBay aspect list ({name, required, allowed}) -> JSON Schema for an
+    item_specifics dict. Values may be a string or a list of strings;
+    "" is always accepted (explicit blank). Aspects whose entry_types
+    (from enforced_requirements) is free_text/override_allowed take any string.
+    """
+    entry_types = entry_types or {}
+    props: dict = {}
+    required: list[str] = []
+    for a in aspects:
+        if not isinstance(a, dict) or not a.get("name"):
+            continue
+        name = str(a["name"])
+        allowed = a.get("allowed")
+        if isinstance(allowed, list) and allowed and entry_types.get(name) not in OPEN_ENTRY_TYPES:
+            value = {"enum": [""] + [str(v) for v in allowed]}
+        else:
+            value = {"type": "string"}
+        props[name] = {"anyOf": [value, {"type": "array", "items": value}]}
+        if a.get("required"):
+            required.append(name)
+    return {"type": "object", "properties": props, "required": required}
+
+
+def _compile_fallback(schema: dict) -> Callable[[dict], dict]:
+    # Same checks as the JSON Schema above, against frozensets.
+    allowed: dict[str, frozenset | None] = {}
+    for name, prop in schema["properties"].items():
+        value = prop["anyOf"][0]
+        allowed[name] = frozenset(value["enum"]) if "enum" in value else None
+    required = tuple(schema["required"])
+
+    def validate(data: dict) -> dict:
+        if not isinstance(data, dict):
+            raise ValueError("data must be object")
+        for name in required:
+            if name not in data:
+                raise ValueError(f"data must contain [{name!r}] properties")
+        for name, val in data.items():
+            if name not in allowed:
+                continue
+            ok = allowed[name]
+            for v in val if isinstance(val, list) else (val,):
+                if not isinstance(v, str) or (ok is not None and v not in ok):
+                    raise ValueError(f"data.{name} has invalid value {v!r}")
+        return data
+
+    return validate
+
+
+def _enforced_path(schema_path: Path) -> Path:
+    # ebay/schema/cat_X.json -> ebay/enforced_requirements/cat_X.json
+    return schema_path.parent.parent / "enforced_requirements" / schema_path.name
+
+
+def get_validator(path: Path) -> Callable[[dict], dict]:
+    """
+    Validator for item_specifics against a category aspect file (plus its
+    enforced_requirements entry_types, if present). Built once per file
+    version and cached; raises ValueError on the first invalid aspect.
+    """
+    enforced_path = _enforced_path(path)
+    enforced_mtime = enforced_path.stat().st_mtime_ns if enforced_path.exists() else 0
+    key = (path, path.stat().st_mtime_ns, enforced_mtime)
+    v = _COMPILED.get(key)
+    if v is not None:
+        return v
+
+    aspects = _load_json_cached(str(path), key[1])
+    if not isinstance(aspects, list):
+        raise ValueError(f"Category schema is not an aspect list: {path}")
+    entry_types = {}
+    if enforced_mtime:
+        enforced = _load_json_cached(str(enforced_path), enforced_mtime)
+        if isinstance(enforced, dict) and isinstance(enforced.get("entry_types"), dict):
+            entry_types = enforced["entry_types"]
+    schema = aspects_to_json_schema(aspects, entry_types)
+    if fastjsonschema is not None:
+        v = fastjsonschema.compile(schema)
+    else:
+        v = _compile_fallback(schema)
+    _COMPILED[key] = v
+    return v
 
 
 def main() -> int:
@@ -59,8 +175,11 @@ def main() -> int:
             cat_path = SCHEMA / f
             if not cat_path.exists():
                 fail(f"Category {cat_id} references missing file: {f}")
-            else:
-                load_json(cat_path)
+            elif load_json(cat_path):
+                try:
+                    get_validator(cat_path)
+                except Exception as e:
+                    fail(f"Category {cat_id} schema does not compile: {f} :: {e}")
 
     # 3) Policies sanity
     policies = load_json(EBAY / "policies.json")